@@ -0,0 +1,91 @@
+# Keeps the local Entry rows honest about what actually made it onto the
+# internet archive. upload_to_iarchive.py pushes disks up; this module pulls
+# the resulting state back down onto Entry.archive_sync_status.
+import functools
+
+from django.utils import timezone
+
+from .models import Entry
+
+# internetarchive (and the requests stack underneath it) is imported on
+# first use rather than at module load, so manage.py commands and web
+# workers that never sync don't pay its import cost
+ia = None
+
+
+def _get_ia():
+    global ia
+    if ia is None:
+        import internetarchive
+        ia = internetarchive
+    return ia
+
+
+class ArchiveSyncError(Exception):
+    """The internet archive could not be reached to check sync state."""
+
+
+@functools.lru_cache(maxsize=1)
+def _probe_ia():
+    """
+    Builds a session once per process and caches the outcome -- the answer
+    doesn't change mid-run, so repeat callers skip the probe entirely.
+    Returns the failure, or None when the archive is reachable.
+    """
+    try:
+        _get_ia().get_session()
+    except Exception as error:
+        return error
+    return None
+
+
+def check_ia_available():
+    """
+    Confirms the internet archive endpoint is reachable before a sync run.
+    Raises ArchiveSyncError when a session cannot be established.
+    """
+    error = _probe_ia()
+    if error is not None:
+        raise ArchiveSyncError(
+            "internet archive unavailable: {}".format(error)) from error
+    return True
+
+
+def check_entry_sync_status(entry):
+    """
+    Compares one entry against its archive.org item and returns the
+    Entry.ArchiveSyncStatus it should carry. Leaves a note on the entry
+    when the item is missing; does not save.
+    """
+    item = _get_ia().get_item(entry.identifier)
+    if not item.exists:
+        entry.sync_notes = "no item found for {}".format(entry.identifier)
+        return Entry.ArchiveSyncStatus.OUT_OF_SYNC
+    entry.sync_notes = None
+    return Entry.ArchiveSyncStatus.IN_SYNC
+
+
+def bulk_check_sync_status(entries=None):
+    """
+    Re-checks entries against the archive, stamping archive_sync_status,
+    last_sync_check and sync_notes on each row. Defaults to the entries
+    that claim to have been uploaded.
+    """
+    check_ia_available()
+    if entries is None:
+        entries = Entry.objects.filter(uploaded=True)
+    entries = list(entries)
+    now = timezone.now()
+    for entry in entries:
+        status = check_entry_sync_status(entry)
+        entry.archive_sync_status = status
+        entry.last_sync_check = now
+        if status == Entry.ArchiveSyncStatus.IN_SYNC:
+            entry.last_archive_sync = now
+    # One UPDATE per batch instead of a save() round-trip per entry
+    Entry.objects.bulk_update(
+        entries,
+        ['archive_sync_status', 'last_sync_check', 'last_archive_sync',
+         'sync_notes'],
+        batch_size=500)
+    return entries
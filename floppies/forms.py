@@ -3,14 +3,18 @@ from .models import Entry
 from ckeditor.widgets import CKEditorWidget
 
 class EntryForm(forms.ModelForm):
-    description = forms.CharField(widget=CKEditorWidget())
+    description = forms.CharField(widget=CKEditorWidget(), required=False)
     class Meta:
         model = Entry
-        fields = '__all__'  # Includes all fields from the Entry model
+        # The editable surface the entry form renders; listing it here keeps
+        # the create/update views from each carrying their own copy
+        fields = ["identifier", "fullArchivePath", "folder", "title",
+            "creators", "collections", "contributors", "languages",
+            "description", "subjects", "mediatype", "uploaded", "hasFluxFile",
+            "hasFileContents", "needsWork", "readyToUpload"]
         widgets = {
             'date': forms.DateInput(attrs={'type': 'date'}),
             'created_on': forms.DateTimeInput(attrs={'type': 'datetime-local'}),
-            # Add any other specific widgets if required    
+            # Add any other specific widgets if required
             "description": CKEditorWidget(),
         }
-
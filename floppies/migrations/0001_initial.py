@@ -1,5 +1,7 @@
-# Generated by Django 4.2.7 on 2023-12-03 20:40
+# Generated by Django 5.2.17 on 2026-08-28 21:53
 
+import ckeditor.fields
+import django.db.models.deletion
 from django.db import migrations, models
 
 
@@ -15,88 +17,239 @@ class Migration(migrations.Migration):
             name='ArchCollection',
             fields=[
                 ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_date', models.DateTimeField(auto_now_add=True)),
+                ('modified_date', models.DateTimeField(auto_now=True)),
                 ('name', models.CharField(max_length=500)),
             ],
+            options={
+                'abstract': False,
+            },
         ),
         migrations.CreateModel(
             name='Contributor',
             fields=[
                 ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_date', models.DateTimeField(auto_now_add=True)),
+                ('modified_date', models.DateTimeField(auto_now=True)),
                 ('name', models.CharField(max_length=100)),
             ],
+            options={
+                'abstract': False,
+            },
         ),
         migrations.CreateModel(
             name='Creator',
             fields=[
                 ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_date', models.DateTimeField(auto_now_add=True)),
+                ('modified_date', models.DateTimeField(auto_now=True)),
                 ('name', models.CharField(max_length=500)),
             ],
+            options={
+                'abstract': False,
+            },
         ),
         migrations.CreateModel(
-            name='Language',
+            name='ZipContent',
             fields=[
                 ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
-                ('name', models.CharField(max_length=100)),
+                ('created_date', models.DateTimeField(auto_now_add=True)),
+                ('modified_date', models.DateTimeField(auto_now=True)),
+                ('file', models.CharField(max_length=2048)),
+                ('md5sum', models.CharField(blank=True, max_length=32, null=True)),
+                ('suffix', models.CharField(blank=True, max_length=20, null=True)),
+                ('size_bytes', models.BigIntegerField(blank=True, null=True)),
             ],
+            options={
+                'abstract': False,
+            },
         ),
         migrations.CreateModel(
-            name='Mediatype',
+            name='Language',
             fields=[
                 ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
-                ('mediatype', models.CharField(choices=[('TX', 'Texts'), ('ET', 'Etree'), ('AU', 'Audio'), ('MV', 'Movies'), ('SW', 'Software'), ('IM', 'Image'), ('DA', 'Data'), ('WB', 'Web'), ('CO', 'Collection'), ('AC', 'Account')], default='SW', max_length=2)),
+                ('created_date', models.DateTimeField(auto_now_add=True)),
+                ('modified_date', models.DateTimeField(auto_now=True)),
+                ('name', models.CharField(max_length=100)),
             ],
+            options={
+                'abstract': False,
+            },
         ),
         migrations.CreateModel(
-            name='PhotoImage',
+            name='Subject',
             fields=[
                 ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
-                ('image', models.FileField(upload_to='images')),
+                ('created_date', models.DateTimeField(auto_now_add=True)),
+                ('modified_date', models.DateTimeField(auto_now=True)),
+                ('name', models.CharField(max_length=500)),
             ],
+            options={
+                'abstract': False,
+            },
         ),
         migrations.CreateModel(
-            name='RandoFile',
+            name='ZipArchive',
             fields=[
                 ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
-                ('file', models.FileField(upload_to='randoFiles')),
+                ('created_date', models.DateTimeField(auto_now_add=True)),
+                ('modified_date', models.DateTimeField(auto_now=True)),
+                ('archive', models.CharField(max_length=2048)),
             ],
+            options={
+                'abstract': False,
+            },
         ),
         migrations.CreateModel(
-            name='Subject',
+            name='FluxFile',
             fields=[
-                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
-                ('name', models.CharField(max_length=500)),
+                ('created_date', models.DateTimeField(auto_now_add=True)),
+                ('modified_date', models.DateTimeField(auto_now=True)),
+                ('zipContent', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, serialize=False, to='floppies.zipcontent')),
+                ('file', models.CharField(max_length=2048)),
             ],
+            options={
+                'abstract': False,
+            },
         ),
         migrations.CreateModel(
-            name='ZipArchive',
+            name='TextFile',
             fields=[
-                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
-                ('archive', models.FileField(upload_to='archives')),
+                ('created_date', models.DateTimeField(auto_now_add=True)),
+                ('modified_date', models.DateTimeField(auto_now=True)),
+                ('zipContent', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, serialize=False, to='floppies.zipcontent')),
+                ('raw_read', models.TextField()),
+                ('converted', models.TextField(blank=True, null=True)),
             ],
+            options={
+                'abstract': False,
+            },
         ),
         migrations.CreateModel(
             name='Entry',
             fields=[
                 ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
-                ('identifier', models.SlugField(max_length=500)),
-                ('fullArchivePath', models.URLField(blank=True, null=True)),
-                ('folder', models.FileField(upload_to='diskMusteringArea')),
+                ('created_date', models.DateTimeField(auto_now_add=True)),
+                ('modified_date', models.DateTimeField(auto_now=True)),
+                ('identifier', models.CharField(max_length=500)),
+                ('fullArchivePath', models.URLField(blank=True, max_length=600, null=True)),
+                ('folder', models.CharField(blank=True, max_length=2048, null=True)),
                 ('title', models.CharField(max_length=500)),
-                ('date', models.DateField()),
-                ('description', models.TextField()),
+                ('publicationDate', models.DateField(blank=True, null=True)),
+                ('mediatype', models.CharField(choices=[('TX', 'Texts'), ('ET', 'Etree'), ('AU', 'Audio'), ('MV', 'Movies'), ('SW', 'Software'), ('IM', 'Image'), ('DA', 'Data'), ('WB', 'Web'), ('CO', 'Collection'), ('AC', 'Account')], default='SW', max_length=2)),
+                ('description', ckeditor.fields.RichTextField(blank=True, null=True)),
                 ('uploaded', models.BooleanField(default=False)),
                 ('hasFluxFile', models.BooleanField(default=False)),
-                ('hasFileContents', models.BooleanField(default=True)),
+                ('hasFileContents', models.BooleanField(default=False)),
+                ('hasDiskImg', models.BooleanField(default=False)),
                 ('needsWork', models.BooleanField(default=False)),
                 ('readyToUpload', models.BooleanField(default=False)),
-                ('created_on', models.DateTimeField(auto_now_add=True)),
-                ('collections', models.ManyToManyField(to='floppies.archcollection')),
-                ('contributors', models.ManyToManyField(to='floppies.contributor')),
-                ('creators', models.ManyToManyField(to='floppies.creator')),
-                ('languages', models.ManyToManyField(to='floppies.language')),
-                ('photos', models.ManyToManyField(to='floppies.photoimage')),
-                ('randoFiles', models.ManyToManyField(to='floppies.randofile')),
-                ('subjects', models.ManyToManyField(to='floppies.subject')),
+                ('collections', models.ManyToManyField(blank=True, to='floppies.archcollection')),
+                ('contributors', models.ManyToManyField(blank=True, to='floppies.contributor')),
+                ('creators', models.ManyToManyField(blank=True, to='floppies.creator')),
+                ('languages', models.ManyToManyField(blank=True, to='floppies.language')),
+                ('subjects', models.ManyToManyField(blank=True, to='floppies.subject')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='PhotoImage',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_date', models.DateTimeField(auto_now_add=True)),
+                ('modified_date', models.DateTimeField(auto_now=True)),
+                ('image', models.CharField(max_length=2048)),
+                ('entry', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='photos', to='floppies.entry')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='RandoFile',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_date', models.DateTimeField(auto_now_add=True)),
+                ('modified_date', models.DateTimeField(auto_now=True)),
+                ('file', models.CharField(max_length=2048)),
+                ('suffix', models.CharField(blank=True, max_length=10, null=True)),
+                ('entry', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='randos', to='floppies.entry')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='ScriptRun',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_date', models.DateTimeField(auto_now_add=True)),
+                ('modified_date', models.DateTimeField(auto_now=True)),
+                ('text', models.TextField()),
+                ('rumtime', models.DateTimeField(auto_now_add=True)),
+                ('parentPath', models.CharField(blank=True, max_length=2048, null=True)),
+                ('function', models.CharField(blank=True, max_length=512, null=True)),
+                ('script', models.CharField(blank=True, max_length=2048, null=True)),
+                ('entry', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='floppies.entry')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.AddField(
+            model_name='zipcontent',
+            name='zipArchive',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='floppies.ziparchive'),
+        ),
+        migrations.AddField(
+            model_name='ziparchive',
+            name='entry',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='ziparchives', to='floppies.entry'),
+        ),
+        migrations.CreateModel(
+            name='InfoChunk',
+            fields=[
+                ('created_date', models.DateTimeField(auto_now_add=True)),
+                ('modified_date', models.DateTimeField(auto_now=True)),
+                ('fluxFile', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, serialize=False, to='floppies.fluxfile')),
+                ('info_version', models.PositiveSmallIntegerField()),
+                ('creator', models.CharField(max_length=32)),
+                ('drive_type', models.PositiveSmallIntegerField(choices=[(1, '5.25″ SS 40trk 0.25 step'), (2, '3.5″ DS 80trk Apple CLV'), (3, '5.25″ DS 80trk'), (4, '5.25″ DS 40trk'), (5, '3.5″ DS 80trk'), (6, '8″ DS'), (7, '3″ DS 80trk'), (8, '3″ DS 40trk')])),
+                ('write_protected', models.BooleanField()),
+                ('synchronized', models.BooleanField()),
+                ('hard_sector_count', models.PositiveSmallIntegerField()),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='MetaChunk',
+            fields=[
+                ('created_date', models.DateTimeField(auto_now_add=True)),
+                ('modified_date', models.DateTimeField(auto_now=True)),
+                ('fluxFile', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, serialize=False, to='floppies.fluxfile')),
+                ('title', models.CharField(blank=True, max_length=255)),
+                ('subtitle', models.CharField(blank=True, max_length=255, null=True)),
+                ('publisher', models.CharField(blank=True, max_length=255, null=True)),
+                ('developer', models.CharField(blank=True, max_length=255, null=True)),
+                ('copyright', models.CharField(blank=True, max_length=255, null=True)),
+                ('version', models.CharField(blank=True, max_length=255, null=True)),
+                ('language', models.CharField(blank=True, choices=[('en', 'English'), ('es', 'Spanish'), ('fr', 'French'), ('de', 'German'), ('zh', 'Chinese'), ('ja', 'Japanese'), ('it', 'Italian'), ('nl', 'Dutch'), ('pt', 'Portuguese'), ('da', 'Danish'), ('fi', 'Finnish'), ('no', 'Norwegian'), ('sv', 'Swedish'), ('ru', 'Russian'), ('pl', 'Polish'), ('tr', 'Turkish'), ('ar', 'Arabic'), ('th', 'Thai'), ('cs', 'Czech'), ('hu', 'Hungarian'), ('ca', 'Catalan'), ('hr', 'Croatian'), ('el', 'Greek'), ('he', 'Hebrew'), ('ro', 'Romanian'), ('sk', 'Slovak'), ('uk', 'Ukrainian'), ('id', 'Indonesian'), ('ms', 'Malay'), ('vi', 'Vietnamese'), ('zz', 'Other')], max_length=2, null=True)),
+                ('requires_platform', models.CharField(blank=True, max_length=255, null=True)),
+                ('requires_machine', models.CharField(blank=True, max_length=255, null=True)),
+                ('requires_ram', models.CharField(blank=True, max_length=255, null=True)),
+                ('notes', models.TextField(blank=True, null=True)),
+                ('side', models.CharField(blank=True, max_length=255, null=True)),
+                ('side_name', models.CharField(blank=True, max_length=255, null=True)),
+                ('contributor', models.CharField(blank=True, max_length=255, null=True)),
+                ('image_date', models.DateTimeField(blank=True, null=True)),
             ],
+            options={
+                'verbose_name': 'Meta Chunk',
+                'verbose_name_plural': 'Meta Chunks',
+            },
         ),
     ]
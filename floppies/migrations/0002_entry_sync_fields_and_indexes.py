@@ -0,0 +1,54 @@
+# Generated by Django 5.2.17 on 2026-08-28 21:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('floppies', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='entry',
+            name='archive_sync_status',
+            field=models.CharField(choices=[('NS', 'Never Synced'), ('IS', 'In Sync'), ('OS', 'Out of Sync')], default='NS', max_length=2),
+        ),
+        migrations.AddField(
+            model_name='entry',
+            name='duplicates',
+            field=models.ManyToManyField(blank=True, to='floppies.entry'),
+        ),
+        migrations.AddField(
+            model_name='entry',
+            name='last_archive_sync',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='entry',
+            name='last_sync_check',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='entry',
+            name='sync_notes',
+            field=models.TextField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='entry',
+            index=models.Index(fields=['-modified_date'], name='entry_modified_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='entry',
+            index=models.Index(fields=['needsWork', '-modified_date'], name='entry_nw_mod_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='entry',
+            index=models.Index(fields=['needsWork', 'readyToUpload', 'uploaded', '-modified_date'], name='entry_upload_q_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='entry',
+            index=models.Index(fields=['title'], name='entry_title_idx'),
+        ),
+    ]
@@ -1,3 +1,5 @@
+import itertools
+
 from django.db import models
 from ckeditor.fields import RichTextField
 from django.urls import reverse
@@ -97,19 +99,23 @@ class Entry(BaseModel):
         def get_mediatype_key(cls, name):
             # Mapping of string representations to Mediatypes choices
             name_to_key = {
-                "texts": cls.Mediatypes.TEXTS,
-                "etree": cls.Mediatypes.ETREE,
-                "audio": cls.Mediatypes.AUDIO,
-                "movies": cls.Mediatypes.MOVIES,
-                "software": cls.Mediatypes.SOFTWARE,
-                "image": cls.Mediatypes.IMAGE,
-                "data": cls.Mediatypes.DATA,
-                "web": cls.Mediatypes.WEB,
-                "collection": cls.Mediatypes.COLLECTION,
-                "account": cls.Mediatypes.ACCOUNT
+                "texts": cls.TEXTS,
+                "etree": cls.ETREE,
+                "audio": cls.AUDIO,
+                "movies": cls.MOVIES,
+                "software": cls.SOFTWARE,
+                "image": cls.IMAGE,
+                "data": cls.DATA,
+                "web": cls.WEB,
+                "collection": cls.COLLECTION,
+                "account": cls.ACCOUNT
             }
-            return name_to_key.get(name.lower(), cls.Mediatypes.SOFTWARE)
+            return name_to_key.get(name.lower(), cls.SOFTWARE)
 
+    class ArchiveSyncStatus(models.TextChoices):
+        NEVER_SYNCED = "NS", _("Never Synced")
+        IN_SYNC = "IS", _("In Sync")
+        OUT_OF_SYNC = "OS", _("Out of Sync")
 
     identifier = models.CharField(max_length=500)
     fullArchivePath = models.URLField(max_length=600, blank=True, null=True)
@@ -127,13 +133,33 @@ class Entry(BaseModel):
     languages = models.ManyToManyField(Language, blank=True)
     description = RichTextField(blank=True, null=True)
     subjects = models.ManyToManyField(Subject, blank=True)
+    duplicates = models.ManyToManyField('self', blank=True)
     uploaded = models.BooleanField(default=False)
     hasFluxFile = models.BooleanField(default=False)
     hasFileContents = models.BooleanField(default=False)
     hasDiskImg = models.BooleanField(default=False)
     needsWork = models.BooleanField(default=False)
     readyToUpload = models.BooleanField(default=False)
-    
+    archive_sync_status = models.CharField(
+        max_length=2,
+        choices=ArchiveSyncStatus,
+        default=ArchiveSyncStatus.NEVER_SYNCED,
+    )
+    last_sync_check = models.DateTimeField(blank=True, null=True)
+    last_archive_sync = models.DateTimeField(blank=True, null=True)
+    sync_notes = models.TextField(blank=True, null=True)
+
+    class Meta:
+        # Shaped to match IndexView's filter+order queries so the DB can
+        # walk an index and stop at the page size instead of sorting the
+        # whole table; the last one covers the search/default title order
+        indexes = [
+            models.Index(fields=['-modified_date'], name='entry_modified_idx'),
+            models.Index(fields=['needsWork', '-modified_date'], name='entry_nw_mod_idx'),
+            models.Index(fields=['needsWork', 'readyToUpload', 'uploaded', '-modified_date'], name='entry_upload_q_idx'),
+            models.Index(fields=['title'], name='entry_title_idx'),
+        ]
+
     def get_absolute_url(self):
         return reverse("floppies:entry-update", kwargs={"pk": self.pk})
 
@@ -141,17 +167,64 @@ class Entry(BaseModel):
         """
         Returns a list of file paths for the media files (zip archives and photos) related to this entry.
         """
-        media_files = []
-
-        # Add file paths from zip archives
-        for zip_archive in self.ziparchives.all():
-            media_files.append(zip_archive.archive)
-
-        # Add file paths from photos
-        for photo in self.photos.all():
-            media_files.append(photo.image)
+        # .all() so a prefetch_related('ziparchives', 'photos') cache is
+        # honored -- values_list would always hit the database again
+        return list(itertools.chain(
+            (zip_archive.archive for zip_archive in self.ziparchives.all()),
+            (photo.image for photo in self.photos.all()),
+        ))
+
+    def get_file_hashes(self):
+        """
+        Returns the frozenset of md5 hashes for the files inside this entry's zip archives.
+        """
+        # Walk the prefetch cache when one is attached; otherwise one query
+        # against ZipContent beats a query per archive. Frozen because the
+        # hash set is a value to compare, never something to mutate.
+        if 'ziparchives' in getattr(self, '_prefetched_objects_cache', {}):
+            return frozenset(
+                zip_content.md5sum
+                for zip_archive in self.ziparchives.all()
+                for zip_content in zip_archive.zipcontent_set.all()
+                if zip_content.md5sum)
+        return frozenset(ZipContent.objects.filter(
+            zipArchive__entry=self, md5sum__isnull=False,
+        ).values_list('md5sum', flat=True))
+
+    def find_duplicates(self):
+        """
+        Returns the other entries whose zip archives hold the same set of file
+        hashes as this entry. Entries with no hashed contents match nothing.
+        """
+        my_hashes = self.get_file_hashes()
+        if not my_hashes:
+            return []
+        # One aggregate query instead of re-hashing every other entry:
+        # match_count == len(my_hashes) means every hash is matched and
+        # hash_count == len(my_hashes) means there are no extras
+        matches = Entry.objects.exclude(pk=self.pk).annotate(
+            match_count=models.Count(
+                'ziparchives__zipcontent__md5sum',
+                filter=models.Q(ziparchives__zipcontent__md5sum__in=my_hashes),
+                distinct=True),
+            hash_count=models.Count(
+                'ziparchives__zipcontent__md5sum', distinct=True),
+        ).filter(match_count=len(my_hashes), hash_count=len(my_hashes))
+        return list(matches)
+
+    def mark_as_duplicate(self, original):
+        """
+        Links this entry and the original it duplicates; the relation is
+        symmetrical so either side sees the other.
+        """
+        self.duplicates.add(original)
 
-        return media_files
+    def mark_as_duplicates(self, others):
+        """
+        Links this entry to several duplicates at once; add(*others) batches
+        the through-table rows instead of one INSERT pair per entry.
+        """
+        self.duplicates.add(*others)
 
     def __str__(self):
         return self.title
@@ -240,10 +313,7 @@ class MetaChunk(BaseModel):
         Returns the two-letter abbreviation for a given language name.
         If the language is not found, returns None.
         """
-        for abbr, name in cls.LANGUAGES:
-            if name.lower() == language_name.lower():
-                return abbr
-        return None
+        return _LANG_TO_ABBR.get(language_name.lower())
 
     @classmethod
     def get_language_from_abbr(cls, language_abbr):
@@ -251,10 +321,7 @@ class MetaChunk(BaseModel):
         Returns the two-letter abbreviation for a given language name.
         If the language is not found, returns None.
         """
-        for abbr, name in cls.LANGUAGES:
-            if abbr.lower() == language_abbr.lower():
-                return name
-        return None
+        return _ABBR_TO_LANG.get(language_abbr.lower())
 
     def __str__(self):
         return self.title if self.title else "Unnamed Meta Chunk"
@@ -262,3 +329,9 @@ class MetaChunk(BaseModel):
     class Meta:
         verbose_name = "Meta Chunk"
         verbose_name_plural = "Meta Chunks"
+
+# Lookup tables for the language classmethods above, built once at import
+# time; the import scripts call these per flux file, so no per-call scan
+# of LANGUAGES
+_LANG_TO_ABBR = {name.lower(): abbr for abbr, name in MetaChunk.LANGUAGES}
+_ABBR_TO_LANG = {abbr.lower(): name for abbr, name in MetaChunk.LANGUAGES}
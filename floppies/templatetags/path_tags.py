@@ -0,0 +1,17 @@
+from django.template import Library
+from django.utils.html import escape
+from django.utils.safestring import mark_safe
+
+register = Library()
+
+SEPARATOR_SPAN = '<span class="path-separator">/</span>'
+
+
+@register.filter(is_safe=True)
+def style_path(value):
+    """
+    Renders a filesystem path with styled separator spans. The path itself
+    is escaped first, which the old view-side replace() skipped -- archive
+    names are filesystem-derived strings, not trusted HTML.
+    """
+    return mark_safe(escape(str(value)).replace('/', SEPARATOR_SPAN))
@@ -3,9 +3,14 @@ from django.shortcuts import get_object_or_404, render
 from django.urls import reverse
 from django.urls import reverse_lazy
 from django.views import generic
+from django.core.cache import cache
 from django.core.paginator import Paginator
+from django.utils.functional import cached_property
 from django.views.generic import ListView
-from django.db.models import Q
+from django.db.models import Count, Max, Prefetch, Q
+from django.utils.decorators import method_decorator
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import etag
 
 from django.utils import timezone
 from django.views.generic.detail import DetailView
@@ -13,14 +18,76 @@ from django.views.generic.edit import CreateView, DeleteView, UpdateView
 import datetime
 from pathlib import Path
 
+from .forms import EntryForm
 from .models import Entry, ZipContent, ZipArchive
 
 DISK_MUSTERING_DIR = '/Users/pauldevine/Documents/Victor9k Stuff/Disk Mustering Area/'
 
+# The columns the index template actually renders (plus the filter flags);
+# the list page serves plain dicts of these instead of hydrating Entry
+# instances with every column
+INDEX_FIELDS = ('pk', 'identifier', 'title', 'modified_date',
+                'needsWork', 'readyToUpload', 'uploaded')
+
+def _index_etag(request):
+    # One aggregate against the modified_date index; an edit moves the max
+    # and a delete moves the count, so any change invalidates the tag and
+    # revalidation gets a 304 without re-running the whole list pipeline
+    agg = Entry.objects.aggregate(n=Count('pk'), m=Max('modified_date'))
+    if not agg['n']:
+        return None
+    return '"{}:{}"'.format(agg['n'], agg['m'].isoformat())
+
+
+def _entry_etag(request, pk):
+    # O(1) primary-key lookup of one column
+    modified = Entry.objects.filter(pk=pk).values_list(
+        'modified_date', flat=True).first()
+    return '"{}"'.format(modified.isoformat()) if modified else None
+
+
+class CachedCountPaginator(Paginator):
+    """
+    Paginator that briefly caches its COUNT(*), keyed by the filter shape.
+    The stock paginator re-counts the whole table on every page load no
+    matter which page was asked for.
+    """
+    def __init__(self, object_list, per_page, cache_key=None, timeout=60,
+                 **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self.count_cache_key = cache_key
+        self.count_timeout = timeout
+
+    @cached_property
+    def count(self):
+        if not self.count_cache_key:
+            return Paginator.count.func(self)
+        return cache.get_or_set(
+            self.count_cache_key,
+            lambda: Paginator.count.func(self),
+            self.count_timeout,
+        )
+
+
+# no-cache (not no-store): browsers may keep a copy but must revalidate
+# with If-None-Match every time, so an editor's own saves show up
+# immediately while unchanged loads stay cheap 304s
+@method_decorator([cache_control(no_cache=True),
+                   etag(_index_etag)], name='dispatch')
 class IndexView(generic.ListView):
     template_name = "index.html"
     context_object_name = "latest_entry_list"
     paginate_by = 25
+    paginator_class = CachedCountPaginator
+
+    def get_paginator(self, queryset, per_page, **kwargs):
+        # The count only varies with the filter branch, so key the cached
+        # COUNT(*) off the params that change it (ordering doesn't)
+        cache_key = 'entry-count:{}:{}'.format(
+            bool(self.request.GET.get('needswork')),
+            bool(self.request.GET.get('nextupload')))
+        return super().get_paginator(
+            queryset, per_page, cache_key=cache_key, **kwargs)
 
     def get_queryset(self):
         """Return the last twenty-five published entries."""
@@ -35,14 +102,17 @@ class IndexView(generic.ListView):
             queryset = queryset.filter(needsWork=True)
         if nextUpload:
             queryset = queryset.filter(needsWork=False, readyToUpload=True, uploaded=False)
-        return queryset
+        # values() skips model __init__ and descriptor setup per row; the
+        # template's dot lookups work the same on dicts
+        return queryset.values(*INDEX_FIELDS)
 
+@method_decorator([cache_control(no_cache=True),
+                   etag(_entry_etag)], name='dispatch')
 class DetailView(generic.DetailView):
     model = Entry
-    fields = ["identifier", "fullArchivePath", "folder", "title", "creators",
-        "collections", "contributors", "languages", "description", 
-        "subjects", "photos", "randoFile", "uploaded", "hasFluxFile", 
-        "hasFileContents", "needsWork", "readyToUpload"]
+    # The detail template only touches the narrow columns, so skip pulling
+    # the wide text ones (DetailView ignores a fields list anyway)
+    queryset = Entry.objects.defer("description", "sync_notes")
     template_name = "entry_detail.html"
 
 
@@ -52,19 +122,13 @@ class ResultsView(generic.DetailView):
 
 class EntryCreateView(generic.CreateView):
     model = Entry
-    fields = ["identifier", "fullArchivePath", "folder", "title", "creators",
-        "collections", "contributors", "languages", "description", 
-        "subjects", "photos", "randoFiles", "uploaded", "hasFluxFile", 
-        "hasFileContents", "needsWork", "readyToUpload"]
+    form_class = EntryForm
     template_name = "entry_form.html"
 
 
 class EntryUpdateView(generic.UpdateView):
     model = Entry
-    fields = ["identifier", "fullArchivePath", "folder", "title", "creators",
-        "collections", "contributors", "languages", "description", 
-        "subjects", "mediatype", "uploaded", "hasFluxFile", 
-        "hasFileContents", "needsWork", "readyToUpload"]
+    form_class = EntryForm
     template_name = "entry_form.html"
 
     def get_context_data(self, **kwargs):
@@ -73,7 +137,12 @@ class EntryUpdateView(generic.UpdateView):
 
         # Get the Entry instance being updated
         entry = self.object
-        zip_archives = entry.ziparchives.all()
+        # One query for the archives and one for all their contents, with
+        # the flux/meta/text one-to-ones joined in -- instead of a contents
+        # query per archive plus a query per hasattr() probe below
+        zc_qs = ZipContent.objects.select_related('fluxfile__metachunk', 'textfile')
+        zip_archives = entry.ziparchives.prefetch_related(
+            Prefetch('zipcontent_set', queryset=zc_qs, to_attr='prefetched_contents'))
 
         # Preparing the context
         context['entry'] = entry
@@ -82,17 +151,16 @@ class EntryUpdateView(generic.UpdateView):
         for zip_archive in zip_archives:
             path = Path(zip_archive.archive)
             relative_path = path.relative_to(DISK_MUSTERING_DIR)
-            styled_path = str(relative_path).replace('/', '<span class="path-separator">/</span>')
+            # Separator styling lives in the style_path template filter now
             zip_archive_dict = {
-                 'archive': zip_archive, 
-                 'zip_path': relative_path, 
-                 'zip_path_styled': styled_path,
+                 'archive': zip_archive,
+                 'zip_path': relative_path,
                  'zip_contents': []}
-            zip_contents = ZipContent.objects.filter(zipArchive=zip_archive)
 
-            for zip_content in zip_contents:
+            for zip_content in zip_archive.prefetched_contents:
                 zip_content_dict = {'zip_content': zip_content}
-                zip_content_dict['size_kb'] = int(zip_content.size_bytes / 1024) + (zip_content.size_bytes % 1024 > 0) if zip_content.size_bytes else 0
+                # Ceiling division on ints: no float path, no modulo branch
+                zip_content_dict['size_kb'] = -(-zip_content.size_bytes // 1024) if zip_content.size_bytes else 0
 
                 # Only fetch FluxFile and MetaChunk for .a2r or .flux files
                 if zip_content.suffix in ['.a2r', '.flux']:
@@ -118,15 +186,25 @@ class EntryDeleteView(generic.DeleteView):
     model = Entry
     success_url = reverse_lazy("floppies-list")
 
+def search_entries(query):
+    """Return the entries whose title or identifier contains the query string."""
+    query = (query or "").strip()
+    # An empty query would turn into LIKE '%%' -- a full table scan that
+    # hydrates every row -- so return nothing instead
+    if not query:
+        return Entry.objects.none()
+    # The results page only renders pk/title/identifier, so skip the wide
+    # columns (description in particular) when pulling the rows; the
+    # explicit ordering keeps page boundaries stable under pagination
+    return Entry.objects.filter(
+        Q(title__icontains=query) | Q(identifier__icontains=query)
+    ).only('identifier', 'title').order_by('title', 'pk')
+
 class SearchResultsView(ListView):
     model = Entry
     template_name = 'search_results.html'
+    # Caps worst-case render size when a short query matches most rows
+    paginate_by = 25
 
     def get_queryset(self): # new
-        query = self.request.GET.get("q")
-        if query is None:
-            query = ""
-        object_list = Entry.objects.filter(
-            Q(title__icontains=query) | Q(identifier__icontains=query)
-        )
-        return object_list
\ No newline at end of file
+        return search_entries(self.request.GET.get("q"))
\ No newline at end of file
@@ -1,3 +1,4 @@
+import mmap
 import struct
 
 # Constants for chunk IDs (assuming these are defined elsewhere in your C code)
@@ -8,14 +9,16 @@ META_CHUNK_ID = b'META'  # Replace with the actual value
 
 DEBUG = False
 
+# Compiled once at import; version byte, 32-byte creator, then four
+# single-byte fields per the INFO chunk specification
+_INFO_STRUCT = struct.Struct("<B32s4B")
+
 def parse_a2r_info_chunk(data):
-    # Parse the INFO chunk based on the provided specification
-    info_version = struct.unpack_from("<B", data, 0)[0]  # 1 byte at offset 0
-    creator = data[1:33].decode('utf-8').rstrip(' ')     # 32 bytes at offset 1
-    drive_type = struct.unpack_from("<B", data, 33)[0]   # 1 byte at offset 33
-    write_protected = struct.unpack_from("<B", data, 34)[0]  # 1 byte at offset 34
-    synchronized = struct.unpack_from("<B", data, 35)[0] # 1 byte at offset 35
-    hard_sector_count = struct.unpack_from("<B", data, 36)[0] # 1 byte at offset 36
+    # One C-level unpack for the whole fixed-layout record instead of a
+    # struct call (and a 1-tuple allocation) per field
+    (info_version, creator_bytes, drive_type, write_protected,
+     synchronized, hard_sector_count) = _INFO_STRUCT.unpack_from(data, 0)
+    creator = creator_bytes.decode('utf-8').rstrip(' ')
 
     return {
         "info_version": info_version,
@@ -27,37 +30,60 @@ def parse_a2r_info_chunk(data):
     }
 
 def parse_a2r_meta_chunk(data):
-    # Decode the binary data to string
-    meta_str = data.decode('UTF-8')
-    
-    # Split the string into lines
-    lines = meta_str.strip().split('\n')
-        
-    # Dictionary to hold the parsed metadata
-    meta_data = {}
-
-    # Iterate over each line and extract key-value pairs
-    for line in lines:
-        # Split the line by tab to separate key and value
-        parts = line.split('\t')
-        
-        # Check if line has at least two parts (key and value)
-        if len(parts) >= 2:
-            key = parts[0].strip()
-            value = parts[1].strip()
-            meta_data[key] = value
-
-    return meta_data
+    # Decode the binary data to string (bytes() is a no-op copy for bytes
+    # input and materializes memoryview slices from the mmap path)
+    meta_str = bytes(data).decode('UTF-8')
+
+    # One key-value pair per tab-separated line; partition() finds the key
+    # and value in a single C call and lines without a tab are skipped
+    return {key.strip(): value.strip()
+            for line in meta_str.splitlines()
+            if '\t' in line
+            for key, _, value in (line.partition('\t'),)}
+
+# Dispatch table for the chunk loops: output key and parser per chunk id.
+# Anything absent (RWCP, SLVD, unknown) takes the skip path, so a capture
+# that is mostly flux data pays one dict probe per chunk instead of a
+# comparison cascade
+_CHUNK_PARSERS = {
+    INFO_CHUNK_ID: ("INFO", parse_a2r_info_chunk),
+    META_CHUNK_ID: ("META", parse_a2r_meta_chunk),
+}
 
 def read_a2r_file(filename):
+    # mmap the file so chunk walking is pure pointer arithmetic -- flux
+    # captures are tens of MB of RWCP data that never get copied into
+    # Python objects this way
+    with open(filename, 'rb') as fd:
+        with mmap.mmap(fd.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return read_a2r_mmap(mm)
+
+def read_a2r_mmap(buffer):
     a2r_data = {
         "INFO": None,
         "META": None
     }
-    with open(filename, 'rb') as data_stream:
-        return read_a2r_datastream(data_stream)
+    view = memoryview(buffer)
+    end = len(view)
+    # Skip the initial 8-byte header, then walk chunk headers by offset;
+    # INFO/META bodies are handed to the parsers as zero-copy slices and
+    # everything else (RWCP included) is skipped by advancing the offset
+    off = 8
+    while off + 8 <= end:
+        chunk_id, chunk_size = struct.unpack_from("<4sI", view, off)
+        off += 8
+        if DEBUG:
+            print("Chunk ID: {}, Chunk Size: {}".format(chunk_id, chunk_size))
+
+        handler = _CHUNK_PARSERS.get(chunk_id)
+        if handler is not None:
+            key, parse = handler
+            a2r_data[key] = parse(view[off:off + chunk_size])
+        off += chunk_size
+    return a2r_data
 
 def read_a2r_datastream(data_stream):
+    # Kept for non-mmap-able sources, e.g. members read out of a zip file
     a2r_data = {
         "INFO": None,
         "META": None
@@ -75,21 +101,13 @@ def read_a2r_datastream(data_stream):
         if DEBUG:
             print("Chunk ID: {}, Chunk Size: {}".format(chunk_id, chunk_size))
 
-        # Ensure to read or skip the entire chunk to align for the next chunk
-        if chunk_id == b'INFO':
-            # Read the INFO chunk data and parse it
-            info_data = data_stream.read(chunk_size)
-            a2r_data["INFO"] = parse_a2r_info_chunk(info_data)
-        elif chunk_id == b'RWCP':
-            # Process RWCP chunk
-            rwcp_data = data_stream.read(chunk_size)
-            # ... (Process rwcp_data)
-        elif chunk_id == b'META':
-            # Read the META chunk data and parse it
-            meta_data = data_stream.read(chunk_size)
-            a2r_data["META"] = parse_a2r_meta_chunk(meta_data)
+        # Read chunks we parse; everything else (RWCP included) is skipped
+        # with a seek to align for the next chunk
+        handler = _CHUNK_PARSERS.get(chunk_id)
+        if handler is not None:
+            key, parse = handler
+            a2r_data[key] = parse(data_stream.read(chunk_size))
         else:
-            # Skip unknown chunks
             data_stream.seek(chunk_size, 1)
 
         # Debugging: Show the file position after processing each chunk
@@ -13,6 +13,7 @@ from operator import itemgetter
 import re
 from datetime import datetime, timedelta
 import argparse
+import concurrent.futures
 import zipfile
 import hashlib
 from osxmetadata import OSXMetaData
@@ -26,10 +27,11 @@ sys.path.insert(0, '/Users/pauldevine/projects/disk_db/victordisk')
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "victordisk.settings")
 django.setup()
 
+from django.db import transaction
 from floppies.models import Entry, ArchCollection, Contributor, Creator, FluxFile, InfoChunk
 from floppies.models import Language, MetaChunk, Subject, PhotoImage, RandoFile, ZipArchive, ZipContent, ScriptRun
 
-def insert_into_db(folder):
+def build_entry(folder):
     debug_print(folder, "Inserting into disk_db identifier: {} folder_name{}".format(
         folder['identifier'], folder['folder_name']))
     debug_print(folder, "Folder {}".format(str(folder)))
@@ -39,7 +41,7 @@ def insert_into_db(folder):
     else:
         mydescription = None
 
-    entry = Entry(
+    return Entry(
         identifier = folder['identifier'],
         fullArchivePath = "https://archive.org/details/{}".format(folder['identifier']),
         folder = folder['folder_path'],
@@ -52,20 +54,34 @@ def insert_into_db(folder):
         hasDiskImg = folder['hasDiskImgFile'],
         description = mydescription
     )
-    entry.save()
-    folder["id"]=entry.pk
-
-    importRun = ScriptRun(
-        entry = entry,
-        text = folder['debug_text'],
-        parentPath = folder['parent_path'],
-        script = "create_records_from_diskmustering.py",
-        function = "insert_into_db",
-    )
-    importRun.save()
+
+#one transaction (and one fsync) for the whole run; a failure part-way
+#through rolls back cleanly instead of leaving entries without script runs
+@transaction.atomic
+def insert_into_db(folders):
+    #one INSERT batch for the entries and one for their script runs instead
+    #of a save() round-trip per folder; bulk_create hands back the pks
+    entries = Entry.objects.bulk_create(
+        [build_entry(folder) for folder in folders], batch_size=500)
+
+    import_runs = []
+    for folder, entry in zip(folders, entries):
+        folder["id"] = entry.pk
+        import_runs.append(ScriptRun(
+            entry = entry,
+            text = folder['debug_text'],
+            parentPath = folder['parent_path'],
+            script = "create_records_from_diskmustering.py",
+            function = "insert_into_db",
+        ))
+    ScriptRun.objects.bulk_create(import_runs, batch_size=500)
 
     return
 
+#module-level so ProcessPoolExecutor can pickle it for the workers
+def extract_details(folder_name):
+    return mustering.get_file_details(folder_name, None)
+
 # Main function remains the same
 def main():
     parser = argparse.ArgumentParser(description='Iterates through a local folder and extracts internet archive meta data for django.')
@@ -81,14 +97,36 @@ def main():
     #returns a list of folders that are tagged yellow in the macos finder
     files_with_tag = mustering.get_files_with_tag_in_folder(tag_name, parent_path)
 
-    # Iterate through each folder in the parent directory
+    # Iterate through each folder in the parent directory, skipping any
+    # whose contents are untouched since the last successful run
+    signatures = mustering.load_signature_cache()
     folder_list = []
     for folder_name in files_with_tag:
-        details = mustering.get_file_details(folder_name, None) 
-        insert_into_db(details)
-        mustering.update_entry_details(details)
+        if signatures.get(str(folder_name)) == mustering.folder_signature(folder_name):
+            print("Skipping unchanged folder {}".format(folder_name))
+            continue
         folder_list.append(folder_name)
-        
+
+    #each folder's zip CRC + md5 work is independent and CPU-bound, so fan
+    #the extraction out across processes; the Django writes below stay on
+    #this process, workers only build dicts
+    details_list = []
+    if folder_list:
+        with concurrent.futures.ProcessPoolExecutor(
+                max_workers=min(len(folder_list), os.cpu_count())) as pool:
+            details_list = list(pool.map(extract_details, folder_list))
+
+    #create all the entries in one pass so the inserts batch
+    insert_into_db(details_list)
+    for details in details_list:
+        mustering.update_entry_details(details)
+
+    #re-sign the processed folders now their zips exist, so an unchanged
+    #folder is skipped on the next run
+    for folder_name in folder_list:
+        signatures[str(folder_name)] = mustering.folder_signature(folder_name)
+    mustering.save_signature_cache(signatures)
+
     print("Folder list:")
     for folder in folder_list:
         print("    ", folder)
@@ -11,6 +11,7 @@ from operator import itemgetter
 import re
 from datetime import datetime, timedelta
 import argparse
+import fnmatch
 import zipfile
 import hashlib
 from osxmetadata import OSXMetaData
@@ -28,6 +29,28 @@ from floppies.models import Entry, ArchCollection, Contributor, Creator, FluxFil
 DISK_MUSTERING_DIR = '/Users/pauldevine/Documents/Victor9k Stuff/Disk Mustering Area/'
 IMG_SUFFIXES = ['.jpg', '.jpeg', '.png', '.gif', '.bmp']
 
+#every entry in a mustering run gets the same collections/languages/subjects
+COLLECTION_NAMES = ['open_source_software']
+LANGUAGE_NAMES = ['English']
+SUBJECT_NAMES = ["Victor 9000", "ACT Sirius 1"]
+
+_lookup_cache = {}
+
+def get_lookup(model, names):
+    #these are tiny dimension tables whose names never change mid-run, so
+    #fetch (and backfill) them once per model instead of a get_or_create
+    #round-trip per name per folder
+    key = model.__name__
+    if key not in _lookup_cache:
+        existing = {obj.name: obj for obj in model.objects.filter(name__in=names)}
+        missing = [model(name=name) for name in names if name not in existing]
+        if missing:
+            model.objects.bulk_create(missing)
+            for obj in missing:
+                existing[obj.name] = obj
+        _lookup_cache[key] = existing
+    return _lookup_cache[key]
+
 def debug_print(folder_dict, message):
     print(message)
     folder_dict["debug_text"] += str(message)
@@ -41,61 +64,103 @@ def check_dir_exists(directory):
     return os.path.isdir(directory)
 
 def get_files_from_dir(parent_path):
-    # List all files in the sub-directory
+    # List all files under the directory with a scandir stack; DirEntry
+    # answers is_dir() from the readdir batch, so there's no stat() and no
+    # path join per entry like the old listdir version paid
     file_list = []
-    for file_name in os.listdir(parent_path):
-        # Ignore hidden files
-        if file_name.startswith('.'):
-            continue
-        file_path = os.path.join(parent_path, file_name)
-        file_list.append(file_path)
-        
-        #check if we're a directory, recurse there too
-        if os.path.isdir(file_path):
-            file_list + get_files_from_dir(file_path)
+    stack = [str(parent_path)]
+    while stack:
+        current = stack.pop()
+        with os.scandir(current) as entries:
+            for entry in entries:
+                # Ignore hidden files
+                if entry.name.startswith('.'):
+                    continue
+                file_list.append(entry.path)
+
+                #if we're a directory, walk its contents too (the old
+                #recursive call built the sub-tree list and discarded it)
+                if entry.is_dir():
+                    stack.append(entry.path)
 
     return file_list
 
 def md5(fname):
-    hash_md5 = hashlib.md5()
+    #file_digest hashes in C with 1 MiB reads instead of looping 4 KB
+    #chunks through Python, and it releases the GIL while it runs
     with open(fname, "rb") as f:
-        for chunk in iter(lambda: f.read(4096), b""):
-            hash_md5.update(chunk)
-    return hash_md5.hexdigest()
+        return hashlib.file_digest(f, hashlib.md5, _bufsize=1 << 20).hexdigest()
 
 
 def get_files_with_tag_in_folder(tag_name, folder_path):
     tagged_files = []
 
-    # Walk through the directory
-    for root, dirs, files in os.walk(folder_path):
-        for folder in dirs:
-            dir_path = os.path.join(root, folder)
-            metadata = OSXMetaData(dir_path)
-
-            # Check if the file has the specified tag
-            if any(tag.name == tag_name for tag in metadata.tags):
-                tagged_files.append(dir_path)
+    # Walk the tree with scandir directly; DirEntry answers is_dir() from
+    # the readdir batch, so we skip the stat() per file that os.walk spends
+    # assembling file lists this function never looks at
+    stack = [str(folder_path)]
+    while stack:
+        current = stack.pop()
+        with os.scandir(current) as entries:
+            for dir_entry in entries:
+                if not dir_entry.is_dir(follow_symlinks=False):
+                    continue
+                metadata = OSXMetaData(dir_entry.path)
+
+                # Check if the file has the specified tag
+                if any(tag.name == tag_name for tag in metadata.tags):
+                    tagged_files.append(dir_entry.path)
+                stack.append(dir_entry.path)
     return tagged_files
 
+#sidecar cache of folder signatures from previous runs; folders whose
+#signature is unchanged skip the zip rebuild and re-hash entirely
+SIGNATURE_CACHE_PATH = os.path.expanduser("~/.victor_disk_cache.json")
+
+def folder_signature(folder):
+    #newest mtime (ns) anywhere under the folder, the folder itself
+    #included -- any file added, removed or edited moves it
+    newest = os.stat(folder).st_mtime_ns
+    for path in get_files_from_dir(folder):
+        newest = max(newest, os.lstat(path).st_mtime_ns)
+    return newest
+
+def load_signature_cache():
+    try:
+        with open(SIGNATURE_CACHE_PATH) as cache_file:
+            return json.load(cache_file)
+    except (OSError, ValueError):
+        #no cache yet (or an unreadable one) just means nothing is skipped
+        return {}
+
+def save_signature_cache(signatures):
+    with open(SIGNATURE_CACHE_PATH, "w") as cache_file:
+        json.dump(signatures, cache_file)
+
 def isRecent(file_path):
     last_modified_time = os.path.getmtime(file_path)
     last_modified_datetime = datetime.fromtimestamp(last_modified_time)
     current_time = datetime.now()
     return (current_time - last_modified_datetime) <= timedelta(hours=24)
 
+#compiled once at import so sanitize_string skips the re cache lookup
+#(and any parse) per call
+_NON_ALNUM = re.compile(r'[^a-z0-9_-]')
+_DASHES = re.compile(r'-+')
+_TRAIL_DASH = re.compile(r'-$')
+
 def sanitize_string(input_str):
     # Convert to lower case
     lower_str = input_str.lower()
-    
+
     # Replace spaces with "-"
     space_replaced = lower_str.replace(" ", "-")
-    
+
     # Replace any characters not in [a-z,A-Z,0-9,_-] with "-"
-    sanitized_str = re.sub(r'[^a-z0-9_-]', '-', space_replaced)
-    sanitized_str = re.sub(r'-+', '-', sanitized_str)
-    sanitized_str = re.sub(r'-$', '', sanitized_str)
-   
+    sanitized_str = _NON_ALNUM.sub('-', space_replaced)
+    sanitized_str = _DASHES.sub('-', sanitized_str)
+    sanitized_str = _TRAIL_DASH.sub('', sanitized_str)
+
     return sanitized_str
 
 # Function to recursively delete empty directories
@@ -108,13 +173,17 @@ def delete_empty_dirs(dir_path):
                 # Directory is not empty, skip it
                 pass
 
+#maps every byte value onto its low 7 bits, built once so the mask below
+#is a single C translate pass instead of a chr(ord(c) & 0x7F) per char
+_ASCII_MASK = bytes(i & 0x7F for i in range(256))
+
 def strip_high_bit(text):
-    if not isinstance(text, str):
-        text = text.decode('utf-8', errors='replace')     
-    # Strip the 8th bit by bitwise AND with 0x7F (0111 1111)
-    newText = ''.join(chr(ord(char) & 0x7F) for char in text)
-    newText = bytes(newText, 'utf-8').decode('utf-8', 'replace')
-    newText = newText.replace("\x00", "\uFFFD") 
+    if isinstance(text, str):
+        text = text.encode('utf-8', errors='replace')
+    # Strip the 8th bit by bitwise AND with 0x7F (0111 1111); masking the
+    # raw bytes before any decode is what old CP/M-era text actually needs
+    newText = text.translate(_ASCII_MASK).decode('ascii')
+    newText = newText.replace("\x00", "\uFFFD")
     newText = newText.replace("\x1a", "")
 
     return newText
@@ -131,43 +200,65 @@ def find_description_file(directory):
 
     directory_path = Path(directory)
 
-    # Iterate over priority files
-    for priority_file in priority_files:
-        # Use rglob for both exact and wildcard pattern matches
-        for file in directory_path.rglob(priority_file):
-            return file
-
-    return None
+    # One walk of the tree, remembering the best-ranked match so far,
+    # instead of a full rglob pass per pattern
+    best_rank = None
+    best_file = None
+    for file in directory_path.rglob("*"):
+        for rank, priority_file in enumerate(priority_files):
+            if best_rank is not None and rank >= best_rank:
+                break
+            if fnmatch.fnmatch(file.name, priority_file):
+                if rank == 0:
+                    return file
+                best_rank = rank
+                best_file = file
+                break
+
+    return best_file
+
+#suffix -> (folder_dict list to append to, hasX flag to raise); one dict
+#probe per file replaces the cascade of suffix comparisons. Images are
+#handled separately since they also depend on the parent folder.
+_SUFFIX_BUCKET = {
+    '.zip': ("zip_files", None),
+    '.flux': ("flux_files", "hasFluxFile"),
+    '.a2r': ("flux_files", "hasFluxFile"),
+    '.img': ("disk_img_files", "hasDiskImgFile"),
+}
+
+#everything outside these suffixes counts as loose "other" content
+_EXCLUDE_SUFFIXES = frozenset(_SUFFIX_BUCKET) | frozenset(IMG_SUFFIXES)
 
 def extract_filetypes_from_dir(folder_dict, file_list):
-         
-    debug_print(folder_dict, file_list) 
+
+    debug_print(folder_dict, file_list)
 
     for f in file_list:
-        path = Path(f)
-        filename = path.name
-        muster_path = str(path)
-        
-        debug_print(folder_dict, "Adding muster:" + str(muster_path) + " filename:" + str(filename))
+        #plain string ops per file -- no Path allocation, and name/suffix/
+        #parent are each computed exactly once
+        muster_path = str(f)
+        filename = os.path.basename(muster_path)
+        suffix = os.path.splitext(filename)[1]
+        parent = os.path.dirname(muster_path)
+
+        debug_print(folder_dict, "Adding muster:" + muster_path + " filename:" + filename)
         #create segmented file list
-        if path.suffix == '.zip':
-            folder_dict["zip_files"].append(muster_path)
-        debug_print(folder_dict,"path.suffix: {} path.parent: {}".format(path.suffix, path.parent))
-        if path.suffix in IMG_SUFFIXES and "Mustering" in str(path.parent):
+        bucket = _SUFFIX_BUCKET.get(suffix)
+        if bucket is not None:
+            bucket_list, bucket_flag = bucket
+            folder_dict[bucket_list].append(muster_path)
+            if bucket_flag:
+                folder_dict[bucket_flag] = True
+        debug_print(folder_dict,"path.suffix: {} path.parent: {}".format(suffix, parent))
+        if suffix in IMG_SUFFIXES and "Mustering" in parent:
             folder_dict["front_jpg_files"].append(muster_path)
-        if (path.suffix == '.flux' or path.suffix == '.a2r'):
-            folder_dict["flux_files"].append(muster_path)
-            folder_dict["hasFluxFile"] = True
-        if path.suffix == '.img':
-            folder_dict["disk_img_files"].append(muster_path)
-            folder_dict["hasDiskImgFile"] = True
-        if path.is_dir():
+        #the one stat syscall in the loop
+        if os.path.isdir(muster_path):
             debug_print(folder_dict,"Adding sub_folder " + muster_path + " to sub_folders")
             folder_dict["sub_folders"].append(muster_path)
             folder_dict["hasFileContents"] = True
-        extensions = [".zip", ".flux", ".a2r", ".img"] + IMG_SUFFIXES
-        exclude_ext = tuple(extensions) 
-        if path.suffix not in extensions:
+        if suffix not in _EXCLUDE_SUFFIXES:
             folder_dict["other_files"].append(muster_path)
             folder_dict["hasFileContents"] = True
     return
@@ -325,49 +416,43 @@ def update_entry_photo_details(folder):
     print("\n\n\n\n\nfolder:\n")
     print(folder)
 
-    all_zip_contents = []
-    parent = folder['parent_path']
     jpg_files = folder.get('front_jpg_files', [])
     #insert images
 
-    for name in jpg_files:
-        photo, created = PhotoImage.objects.get_or_create(
-            image=name,
-            entry = entry,
-        )
-        entry.photos.add(photo)
-    entry.save()
+    #one existence query and one INSERT batch for the folder's photos
+    #instead of a get_or_create round-trip per jpg
+    existing = set(entry.photos.values_list('image', flat=True))
+    PhotoImage.objects.bulk_create(
+        [PhotoImage(image=name, entry=entry)
+         for name in jpg_files if name not in existing])
 
 def update_entry_collections(folder):
     entry = Entry.objects.get(pk=folder["id"])
-    # Handling collections
-    collection_names = ['open_source_software']
-    for name in collection_names:
-        collection, created = ArchCollection.objects.get_or_create(name=name)
-        entry.collections.add(collection)
-    entry.save()
+    # Handling collections; write the join rows directly -- ignore_conflicts
+    # makes re-runs no-ops without the SELECT that .add() issues first
+    collections = get_lookup(ArchCollection, COLLECTION_NAMES)
+    Entry.collections.through.objects.bulk_create(
+        [Entry.collections.through(entry_id=entry.pk, archcollection_id=collection.pk)
+         for collection in collections.values()],
+        batch_size=1000, ignore_conflicts=True)
 
 def update_entry_languages(folder):
     entry = Entry.objects.get(pk=folder["id"])
     # Handling languages
-    language_names = ['English']
-    if isinstance(language_names, str):
-        language_names = [language_names]
-    for name in language_names:
-        language, created = Language.objects.get_or_create(name=name)
-        entry.languages.add(language)
-    entry.save()
+    languages = get_lookup(Language, LANGUAGE_NAMES)
+    Entry.languages.through.objects.bulk_create(
+        [Entry.languages.through(entry_id=entry.pk, language_id=language.pk)
+         for language in languages.values()],
+        batch_size=1000, ignore_conflicts=True)
 
 def update_entry_subjects(folder):
     entry = Entry.objects.get(pk=folder["id"])
     # Handling subjects
-    subject_names = ["Victor 9000","ACT Sirius 1"]
-    if isinstance(subject_names, str):
-        subject_names = subject_names.split(";")
-    for name in subject_names:
-        subject, created = Subject.objects.get_or_create(name=name)
-        entry.subjects.add(subject)  
-    entry.save()
+    subjects = get_lookup(Subject, SUBJECT_NAMES)
+    Entry.subjects.through.objects.bulk_create(
+        [Entry.subjects.through(entry_id=entry.pk, subject_id=subject.pk)
+         for subject in subjects.values()],
+        batch_size=1000, ignore_conflicts=True)
 
 def update_entry_details(folder):
     update_entry_photo_details(folder)
@@ -5,6 +5,7 @@
 import zipfile
 import os
 import argparse
+import concurrent.futures
 from osxmetadata import OSXMetaData
 import pathlib
 from pathlib import Path
@@ -62,36 +63,51 @@ def has_zip_files(folder):
             return True
     return False
 
+def hash_zip_members(zip_path):
+    # Streams every member of the open archive straight into the C digest
+    # loop with 1 MiB reads -- no extraction to disk and no re-open per
+    # member. The members are hashed side by side: ZipFile supports
+    # concurrent reads from one handle, and both zlib and file_digest
+    # release the GIL, so threads overlap the decompress + hash work.
+    # Returns {member_name: (md5_hexdigest, size_bytes)}.
+    with zipfile.ZipFile(zip_path, 'r', metadata_encoding = "utf-8") as zipf:
+        infos = zipf.infolist()
+
+        def hash_member(file_info):
+            with zipf.open(file_info) as file:
+                return hashlib.file_digest(file, hashlib.md5, _bufsize=1 << 20)
+
+        with concurrent.futures.ThreadPoolExecutor(
+                max_workers=max(os.cpu_count() - 1, 1)) as pool:
+            digests = pool.map(hash_member, infos)
+            return {file_info.filename: (digest.hexdigest(), file_info.file_size)
+                    for file_info, digest in zip(infos, digests)}
+
 def get_zip_contents(zip_file):
     zip_contents = []
+    member_hashes = hash_zip_members(zip_file)
     with zipfile.ZipFile(zip_file, 'r', metadata_encoding = "utf-8") as zipf:
         for file_info in zipf.infolist():
             #build metadata about each file
             file_meta = {}
             _, file_suffix = os.path.splitext(file_info.filename)
             #some hidden . files were ending up as suffixes too long for the database
-            file_suffix = file_suffix[:20] if file_suffix else None 
-
-            with zipf.open(file_info) as file:
-                # Read the file in chunks and update the MD5 hash
-                hash_md5 = hashlib.md5()
-                for chunk in iter(lambda: file.read(4096), b""):
-                    hash_md5.update(chunk)
-                file_meta['md5sum'] = hash_md5.hexdigest()
-
-                if file_suffix == '.a2r':
-                    #read meta data out of the A2r
-                    file.seek(0, 0)
-                    a2r_data = a2r_reader.read_a2r_datastream(file)
-                    file_meta["a2r_data"] = a2r_data
-                #look for possible description files
-                print("file_info.filename: {} {}".format(file_info.filename,(file_info.filename in DESCRIPTION_FILES)))
-                filename = Path(file_info.filename).name
-                if filename in DESCRIPTION_FILES:
-                    file.seek(0, 0)
+            file_suffix = file_suffix[:20] if file_suffix else None
+
+            file_meta['md5sum'] = member_hashes[file_info.filename][0]
+
+            if file_suffix == '.a2r':
+                #read meta data out of the A2r
+                with zipf.open(file_info) as file:
+                    file_meta["a2r_data"] = a2r_reader.read_a2r_datastream(file)
+            #look for possible description files
+            print("file_info.filename: {} {}".format(file_info.filename,(file_info.filename in DESCRIPTION_FILES)))
+            filename = Path(file_info.filename).name
+            if filename in DESCRIPTION_FILES:
+                with zipf.open(file_info) as file:
                     file_meta["description_file_contents"] = file.read()
                     file_meta["description_file_name"] = file_info.filename
-            file_meta['file_path']= file_info.filename          
+            file_meta['file_path']= file_info.filename
             file_meta['suffix'] = file_suffix
             file_meta['size'] = file_info.file_size
             zip_contents.append(file_meta)